@@ -0,0 +1,197 @@
+"""Mem0 MCP server backed by an in-memory fake of the Mem0 platform.
+
+Used by `example/load_generator.py` to exercise the real MCP tool layer offline. Every
+`MemoryClient` call is answered from a per-process dict after sleeping for
+`FAKE_MEM0_LATENCY_MS` (plus up to `FAKE_MEM0_JITTER_MS`), so no API key or network
+access is needed:
+
+    python example/fake_mem0_server.py                      # stdio
+    python example/fake_mem0_server.py --transport http --port 8081
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_PATH = PROJECT_ROOT / "src"
+if SRC_PATH.exists() and str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+LATENCY_MS = float(os.getenv("FAKE_MEM0_LATENCY_MS", "50"))
+JITTER_MS = float(os.getenv("FAKE_MEM0_JITTER_MS", "25"))
+
+
+def _scope_value(filters: Optional[Dict[str, Any]], field: str) -> Optional[str]:
+    """Pull a plain `field` equality out of the server's AND-wrapped filters."""
+
+    for clause in (filters or {}).get("AND", []):
+        value = clause.get(field) if isinstance(clause, dict) else None
+        if isinstance(value, str):
+            return value
+    return None
+
+
+class FakeMemoryClient:
+    """Drop-in stand-in for `mem0.MemoryClient` covering the calls the server makes."""
+
+    _memories: Dict[str, Dict[str, Any]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, api_key: Optional[str] = None, **_: Any) -> None:
+        self.api_key = api_key
+
+    @staticmethod
+    def _sleep(enable_graph: bool = False) -> None:
+        delay = LATENCY_MS + random.uniform(0, JITTER_MS)
+        # graph queries cost noticeably more upstream; mimic that so graph isolation shows up
+        time.sleep(delay * (3 if enable_graph else 1) / 1000)
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    def _matching(self, user_id: Optional[str]) -> list[Dict[str, Any]]:
+        with self._lock:
+            return [
+                m for m in self._memories.values() if user_id is None or m["user_id"] == user_id
+            ]
+
+    def add(self, messages: list[Dict[str, str]], **kwargs: Any) -> Dict[str, Any]:
+        self._sleep(kwargs.get("enable_graph", False))
+        text = " ".join(message["content"] for message in messages)
+        memory = {
+            "id": str(uuid.uuid4()),
+            "memory": text,
+            "user_id": kwargs.get("user_id") or kwargs.get("agent_id") or kwargs.get("run_id"),
+            "metadata": kwargs.get("metadata"),
+            "created_at": self._now(),
+            "updated_at": self._now(),
+        }
+        with self._lock:
+            self._memories[memory["id"]] = memory
+        return {"results": [{"id": memory["id"], "memory": text, "event": "ADD"}]}
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        enable_graph: bool = False,
+        **_: Any,
+    ) -> Dict[str, Any]:
+        self._sleep(enable_graph)
+        words = set(query.lower().split())
+        scored = []
+        for memory in self._matching(_scope_value(filters, "user_id")):
+            overlap = len(words & set(memory["memory"].lower().split()))
+            if overlap:
+                scored.append({**memory, "score": overlap / max(len(words), 1)})
+        scored.sort(key=lambda m: m["score"], reverse=True)
+        response: Dict[str, Any] = {"results": scored[: limit or 10]}
+        if enable_graph:
+            response["relations"] = self._relations(response["results"])
+        return response
+
+    def get_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        enable_graph: bool = False,
+        **_: Any,
+    ) -> Dict[str, Any]:
+        self._sleep(enable_graph)
+        memories = self._matching(_scope_value(filters, "user_id"))
+        size = page_size or 10
+        start = ((page or 1) - 1) * size
+        response: Dict[str, Any] = {
+            "count": len(memories),
+            "results": memories[start : start + size],
+        }
+        if enable_graph:
+            response["relations"] = self._relations(response["results"])
+        return response
+
+    @staticmethod
+    def _relations(memories: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+        return [
+            {"source": memory["user_id"], "relationship": "remembers", "target": word}
+            for memory in memories
+            for word in memory["memory"].split()
+        ]
+
+    def get(self, memory_id: str) -> Dict[str, Any]:
+        self._sleep()
+        with self._lock:
+            memory = self._memories.get(memory_id)
+        return memory or {"message": "Memory not found"}
+
+    def update(self, memory_id: str, text: str, **_: Any) -> Dict[str, Any]:
+        self._sleep()
+        with self._lock:
+            memory = self._memories.get(memory_id)
+            if memory is None:
+                return {"message": "Memory not found"}
+            memory.update(memory=text, updated_at=self._now())
+        return {"message": "Memory updated successfully!"}
+
+    def delete(self, memory_id: str) -> Dict[str, Any]:
+        self._sleep()
+        with self._lock:
+            self._memories.pop(memory_id, None)
+        return {"message": "Memory deleted successfully!"}
+
+    def delete_all(self, **scope: Any) -> Dict[str, Any]:
+        self._sleep()
+        owner = scope.get("user_id") or scope.get("agent_id") or scope.get("run_id")
+        with self._lock:
+            for memory_id in [k for k, m in self._memories.items() if m["user_id"] == owner]:
+                del self._memories[memory_id]
+        return {"message": "Memories deleted successfully!"}
+
+    def users(self) -> Dict[str, Any]:
+        self._sleep()
+        counts: Dict[str, int] = {}
+        for memory in self._matching(None):
+            counts[memory["user_id"]] = counts.get(memory["user_id"], 0) + 1
+        results = [
+            {"name": name, "type": "user", "total_memories": total}
+            for name, total in counts.items()
+        ]
+        return {"count": len(results), "results": results}
+
+    def delete_users(self, **scope: Any) -> Dict[str, Any]:
+        self.delete_all(**scope)
+        return {"message": "Entity deleted successfully."}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8081")))
+    args = parser.parse_args()
+
+    # the server reads its env at import time, so configure it before importing
+    os.environ.setdefault("MEM0_API_KEY", "fake-mem0-key")
+    os.environ["PORT"] = str(args.port)
+    from mem0_mcp_server import http_entry, server
+
+    server.MemoryClient = FakeMemoryClient  # type: ignore[misc,assignment]
+    if args.transport == "http":
+        http_entry.main()
+    else:
+        server.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""Headless load generator for the Mem0 MCP server.
+
+Replays agent traces across many concurrent Pydantic AI sessions. Each session uses a
+stub LLM (`FunctionModel`) that emits the trace's tool calls, so every turn exercises
+the real MCP client/server path without an LLM provider. By default each session spawns
+`example/fake_mem0_server.py` over stdio (one server per client, like desktop hosts);
+`--transport http` starts one shared fake server over streamable HTTP instead, and
+`--transport config` reuses the REPL's server definition (`MEM0_MCP_CONFIG_PATH`, else
+`example/config.json`). Config mode runs the real server against the real Mem0 API.
+
+    python example/load_generator.py --sessions 50 --turns 8
+    python example/load_generator.py --transport http --sessions 200 --record traces.jsonl
+    python example/load_generator.py --transport http --trace traces.jsonl --json report.json
+
+A trace file holds one JSON object per session: `{"user_id": ..., "turns": [[call, ...]]}`
+where each call is `{"tool": name, "args": {...}}`; calls in one turn are issued together
+(fan-out) the same way a model requesting parallel tool calls would.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pydantic_ai import Agent, ModelRetry, RunContext
+from pydantic_ai.mcp import CallToolFunc, MCPServer, MCPServerStdio, MCPServerStreamableHTTP
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    RetryPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from pydantic_ai_repl import CONFIG_PATH, DEFAULT_TIMEOUT, EXAMPLE_DIR, _load_server_from_config
+
+FAKE_SERVER_PATH = EXAMPLE_DIR / "fake_mem0_server.py"
+TOOL_MIX = {"add_memory": 0.3, "search_memories": 0.5, "get_memories": 0.2}
+VOCABULARY = "coffee tea berlin tokyo hiking chess python rust jazz sushi project deadline".split()
+
+
+@dataclass
+class LoadStats:
+    connect_latency: list[float] = field(default_factory=list)
+    session_latency: list[float] = field(default_factory=list)
+    turn_latency: list[float] = field(default_factory=list)
+    fan_out: list[int] = field(default_factory=list)
+    tool_latency: Dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    tool_errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    failed_sessions: int = 0
+
+
+def synthetic_traces(
+    sessions: int, turns: int, max_fan_out: int, users: int, graph_ratio: float, seed: int
+) -> list[Dict[str, Any]]:
+    """Generate add/search/get mixes resembling what Mem0Guide issues in the REPL."""
+
+    rng = random.Random(seed)
+    tools, weights = zip(*TOOL_MIX.items())
+    traces = []
+    for index in range(sessions):
+        user_id = f"load-user-{index % users}"
+        trace_turns = []
+        for _ in range(turns):
+            calls = []
+            for tool in rng.choices(tools, weights, k=rng.randint(1, max_fan_out)):
+                words = " ".join(rng.sample(VOCABULARY, 3))
+                scope = {"AND": [{"user_id": user_id}]}
+                if tool == "add_memory":
+                    args: Dict[str, Any] = {"text": f"I like {words}", "user_id": user_id}
+                elif tool == "search_memories":
+                    args = {"query": words, "filters": scope, "limit": 5}
+                else:
+                    args = {"filters": scope, "page_size": 10}
+                if tool != "add_memory" and rng.random() < graph_ratio:
+                    args["enable_graph"] = True
+                calls.append({"tool": tool, "args": args})
+            trace_turns.append(calls)
+        traces.append({"user_id": user_id, "turns": trace_turns})
+    return traces
+
+
+def stub_model(turns: list[list[Dict[str, Any]]]) -> FunctionModel:
+    """Model that answers turn N's prompt with that turn's tool calls, then a short reply."""
+
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        last = messages[-1]
+        prompt = None
+        if isinstance(last, ModelRequest):
+            prompt = next((part for part in last.parts if isinstance(part, UserPromptPart)), None)
+        # tool results (or retry prompts for failed tools) end the turn; never re-issue calls
+        if prompt is None or any(
+            isinstance(part, (ToolReturnPart, RetryPromptPart)) for part in last.parts
+        ):
+            return ModelResponse(parts=[TextPart("done")])
+        calls = turns[int(str(prompt.content))]
+        return ModelResponse(
+            parts=[
+                ToolCallPart(call["tool"], call["args"], tool_call_id=f"call-{position}")
+                for position, call in enumerate(calls)
+            ]
+        )
+
+    return FunctionModel(respond)
+
+
+def timed_tool_calls(stats: LoadStats):
+    async def process_tool_call(
+        ctx: RunContext[Any], call_tool: CallToolFunc, name: str, tool_args: Dict[str, Any]
+    ) -> Any:
+        started = time.perf_counter()
+        try:
+            result = await call_tool(name, tool_args)
+        except ModelRetry:
+            # MCP results with isError=True surface as retries rather than return values
+            stats.tool_errors[name] += 1
+            raise
+        finally:
+            stats.tool_latency[name].append(time.perf_counter() - started)
+        text = result if isinstance(result, str) else json.dumps(result, default=str)
+        if '"error"' in text:
+            stats.tool_errors[name] += 1
+        return result
+
+    return process_tool_call
+
+
+def build_session_server(transport: str, url: Optional[str], stats: LoadStats) -> MCPServer:
+    hook = timed_tool_calls(stats)
+    if transport == "http":
+        return MCPServerStreamableHTTP(url, timeout=DEFAULT_TIMEOUT, process_tool_call=hook)
+    if transport == "config":
+        server = _load_server_from_config()
+        if server is None:
+            raise RuntimeError(
+                f"--transport config found no MCP config at {CONFIG_PATH}; "
+                "set MEM0_MCP_CONFIG_PATH to an existing config file."
+            )
+        server.process_tool_call = hook
+        return server
+    return MCPServerStdio(
+        sys.executable,
+        args=[str(FAKE_SERVER_PATH)],
+        env=os.environ.copy(),
+        timeout=DEFAULT_TIMEOUT,
+        process_tool_call=hook,
+    )
+
+
+async def run_session(
+    trace: Dict[str, Any],
+    transport: str,
+    url: Optional[str],
+    stats: LoadStats,
+    gate: asyncio.Semaphore,
+) -> None:
+    async with gate:
+        server = build_session_server(transport, url, stats)
+        agent = Agent(model=stub_model(trace["turns"]), toolsets=[server])
+        started = time.perf_counter()
+        try:
+            async with agent:
+                stats.connect_latency.append(time.perf_counter() - started)
+                for index, calls in enumerate(trace["turns"]):
+                    turn_started = time.perf_counter()
+                    await agent.run(str(index))
+                    stats.turn_latency.append(time.perf_counter() - turn_started)
+                    stats.fan_out.append(len(calls))
+        except Exception as exc:  # noqa: BLE001 - report and keep the rest of the run going
+            stats.failed_sessions += 1
+            print(f"session for {trace['user_id']} failed: {exc!r}", file=sys.stderr)
+            return
+        stats.session_latency.append(time.perf_counter() - started)
+
+
+def spawn_http_server(port: int) -> subprocess.Popen[bytes]:
+    process = subprocess.Popen(
+        [sys.executable, str(FAKE_SERVER_PATH), "--transport", "http", "--port", str(port)],
+        env={**os.environ, "HOST": "127.0.0.1"},
+        # keep uvicorn's access log and startup banner out of the report and terminal
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + DEFAULT_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Fake Mem0 HTTP server exited during startup.")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"Fake Mem0 HTTP server did not listen on port {port} in time.")
+
+
+def _percentiles(samples: list[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    if len(samples) == 1:
+        # quantiles() needs two points; every percentile of one sample is that sample
+        p50 = p95 = p99 = samples[0]
+    else:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    return {
+        "count": len(samples),
+        "p50_ms": round(p50 * 1000, 1),
+        "p95_ms": round(p95 * 1000, 1),
+        "p99_ms": round(p99 * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+
+
+def build_report(stats: LoadStats, wall_time: float, resources_available: bool) -> Dict[str, Any]:
+    tool_calls = sum(len(samples) for samples in stats.tool_latency.values())
+    report: Dict[str, Any] = {
+        "wall_time_s": round(wall_time, 2),
+        "connect": _percentiles(stats.connect_latency),
+        "sessions": _percentiles(stats.session_latency),
+        "failed_sessions": stats.failed_sessions,
+        "turns": _percentiles(stats.turn_latency),
+        "fan_out": {
+            "mean": round(statistics.fmean(stats.fan_out), 2) if stats.fan_out else 0,
+            "max": max(stats.fan_out, default=0),
+        },
+        "tool_calls": tool_calls,
+        "tool_calls_per_s": round(tool_calls / wall_time, 1) if wall_time else 0,
+        "tools": {
+            name: {**_percentiles(samples), "errors": stats.tool_errors.get(name, 0)}
+            for name, samples in sorted(stats.tool_latency.items())
+        },
+    }
+    if resources_available:
+        # children are reaped by now, so this covers every spawned server process
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        report["server_resources"] = {
+            "cpu_user_s": round(usage.ru_utime, 2),
+            "cpu_system_s": round(usage.ru_stime, 2),
+            "max_rss_mb": round(usage.ru_maxrss / 1024, 1),
+        }
+    return report
+
+
+async def run_load(args: argparse.Namespace, traces: list[Dict[str, Any]]) -> Dict[str, Any]:
+    stats = LoadStats()
+    url = args.url
+    http_process = None
+    if args.transport == "http" and url is None:
+        http_process = spawn_http_server(args.port)
+        url = f"http://127.0.0.1:{args.port}/mcp"
+    gate = asyncio.Semaphore(args.concurrency or len(traces))
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(run_session(trace, args.transport, url, stats, gate) for trace in traces)
+        )
+    finally:
+        wall_time = time.perf_counter() - started
+        if http_process is not None:
+            http_process.terminate()
+            http_process.wait()
+    resources_available = args.transport == "stdio" or http_process is not None
+    return build_report(stats, wall_time, resources_available)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Concurrent agent-session load test.")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "config"],
+        default="stdio",
+        help="config launches the REPL's MCP config, which uses the real Mem0 API.",
+    )
+    parser.add_argument("--url", help="Existing streamable-HTTP endpoint (skips the fake server).")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the spawned HTTP server.")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, help="Max sessions at once (default: all).")
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--max-fan-out", type=int, default=3, help="Max tool calls per turn.")
+    parser.add_argument("--users", type=int, default=10, help="Distinct user_ids to spread over.")
+    parser.add_argument("--graph-ratio", type=float, default=0.0, help="Share of graph reads.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace", type=Path, help="Replay sessions from this JSONL file.")
+    parser.add_argument("--record", type=Path, help="Write the sessions that were run as JSONL.")
+    parser.add_argument("--json", type=Path, help="Also write the report to this file.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.trace:
+        traces = [json.loads(line) for line in args.trace.read_text().splitlines() if line.strip()]
+    else:
+        traces = synthetic_traces(
+            args.sessions, args.turns, args.max_fan_out, args.users, args.graph_ratio, args.seed
+        )
+    if args.record:
+        args.record.write_text("".join(json.dumps(trace) + "\n" for trace in traces))
+
+    report = asyncio.run(run_load(args, traces))
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+    if args.json:
+        args.json.write_text(rendered + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Adaptive admission control for Mem0 tool calls."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from enum import IntEnum
+from typing import Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Admission class of a tool call; cheap reads outrank expensive writes."""
+
+    LOW = 0
+    HIGH = 1
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter driven by in-flight calls and upstream latency.
+
+    Latency is tracked per method, so a slow-by-design call (``add`` runs LLM extraction)
+    is judged against its own baseline rather than the fastest read. A completion counts
+    as congested when the call was dropped or the method's smoothed latency exceeds
+    ``latency_tolerance`` times its baseline; the limit shrinks multiplicatively only
+    after ``congestion_window`` congested completions in a row, and grows by one when an
+    uncongested call finishes while the limiter is at least half utilised. Low-priority
+    calls only get the share of the limit that is not reserved for high-priority reads.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.9,
+        latency_tolerance: float = 2.0,
+        read_reserve: float = 0.25,
+        congestion_window: int = 5,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0.0 < backoff_ratio < 1.0:
+            raise ValueError("backoff_ratio must be between 0 and 1.")
+        if not 0.0 <= read_reserve < 1.0:
+            raise ValueError("read_reserve must be in [0, 1).")
+        if congestion_window < 1:
+            raise ValueError("congestion_window must be at least 1.")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.read_reserve = read_reserve
+        self.congestion_window = congestion_window
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._baselines: Dict[str, float] = {}
+        self._method_smoothed: Dict[str, float] = {}
+        self._smoothed: float | None = None
+        self._congested_streak = 0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def try_acquire(self, priority: Priority = Priority.HIGH) -> bool:
+        """Reserve a slot for one call, or return False if it should be shed."""
+
+        with self._lock:
+            capacity = self._limit
+            if priority is Priority.LOW:
+                capacity = max(1.0, capacity * (1.0 - self.read_reserve))
+            if self._in_flight >= int(capacity):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, latency: float, dropped: bool = False, method: str = "default") -> None:
+        """Return a slot and feed the call's outcome back into the limit."""
+
+        with self._lock:
+            in_flight = self._in_flight
+            self._in_flight = max(0, in_flight - 1)
+            self._smoothed = (
+                latency if self._smoothed is None else 0.8 * self._smoothed + 0.2 * latency
+            )
+            previous = self._method_smoothed.get(method)
+            smoothed = latency if previous is None else 0.8 * previous + 0.2 * latency
+            self._method_smoothed[method] = smoothed
+            baseline = self._baselines.get(method)
+            if baseline is None or latency < baseline:
+                baseline = latency
+            else:
+                # Let the baseline drift up slowly so one lucky sample cannot pin it forever.
+                baseline += (latency - baseline) * 0.01
+            self._baselines[method] = baseline
+
+            if dropped or smoothed > baseline * self.latency_tolerance:
+                self._congested_streak += 1
+                if self._congested_streak >= self.congestion_window:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                    self._congested_streak = 0
+                return
+            self._congested_streak = 0
+            if in_flight * 2 >= self._limit:
+                self._limit = min(float(self.max_limit), self._limit + 1.0)
+
+    def abandon(self) -> None:
+        """Return the slot of a call the client cancelled without judging its latency."""
+
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def retry_after(self) -> int:
+        """Suggest how many seconds a rejected caller should wait before retrying."""
+
+        with self._lock:
+            latency = self._smoothed or 1.0
+            pressure = max(1.0, self._in_flight / max(self._limit, 1.0))
+        return max(1, math.ceil(latency * pressure))
+
+
+class BoundedPool:
+    """Concurrency cap with a bounded wait queue for a separately limited call class.
+
+    Callers ``try_admit`` on the event loop, then ``run`` in a worker thread. A slot is
+    released only when the upstream call really returns, so a call whose caller gave
+    up on a timeout still counts against ``max_concurrency`` while it runs; one still
+    queued when abandoned skips the upstream call entirely.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int) -> None:
+        if max_concurrency < 1 or max_queue < 0:
+            raise ValueError("Expected max_concurrency >= 1 and max_queue >= 0.")
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._smoothed: float | None = None
+
+    @property
+    def capacity(self) -> int:
+        """Most admitted calls (running, queued or abandoned) the pool will hold."""
+
+        return self.max_concurrency + self.max_queue
+
+    def try_admit(self) -> bool:
+        with self._lock:
+            if self._pending >= self.capacity:
+                return False
+            self._pending += 1
+            return True
+
+    def run(self, call: Callable[[], T], abandoned: threading.Event) -> Optional[T]:
+        """Run an admitted ``call`` once a slot frees; returns None if it was abandoned."""
+
+        try:
+            with self._slots:
+                if abandoned.is_set():
+                    return None
+                started = time.monotonic()
+                try:
+                    return call()
+                finally:
+                    latency = time.monotonic() - started
+                    with self._lock:
+                        self._smoothed = (
+                            latency
+                            if self._smoothed is None
+                            else 0.8 * self._smoothed + 0.2 * latency
+                        )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def retry_after(self) -> int:
+        with self._lock:
+            latency = self._smoothed or 1.0
+            waves = self._pending / self.max_concurrency
+        return max(1, math.ceil(latency * waves))
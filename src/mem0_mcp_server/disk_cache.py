@@ -0,0 +1,196 @@
+"""Optional SQLite-backed response cache shared by server processes on the same host."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger("mem0_mcp_server.disk_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    etag TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (scope, key)
+);
+CREATE TABLE IF NOT EXISTS generations (
+    scope TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL
+);
+"""
+
+
+def scope_for(api_key: str) -> str:
+    """Namespace entries per API key without writing the key itself to disk."""
+
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def etag_for(value: str) -> str:
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """Key/value cache of serialized Mem0 responses with TTL, revalidation and size eviction.
+
+    Entries older than ``ttl`` are reported as misses but kept on disk; when the caller
+    stores a fresh response whose etag (``updated_at`` or content hash) matches the stale
+    one, only the timestamps are bumped. Once the file holds more than ``max_bytes`` of
+    payload, least recently read entries are evicted. Every invalidation bumps the
+    scope's generation; ``put`` given the generation read before the upstream fetch
+    refuses to store if it changed, so a read racing an update cannot resurrect the old
+    value. Cache failures after construction are logged and treated as misses so they
+    never fail a tool call.
+    """
+
+    def __init__(
+        self, directory: str | Path, max_bytes: int = 64 * 1024 * 1024, ttl: float = 300.0
+    ) -> None:
+        self.path = Path(directory).expanduser() / "mem0-mcp-cache.sqlite3"
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # entries hold plaintext memories, so keep them private to the server's user
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.path.touch(mode=0o600, exist_ok=True)
+        for path in (self.path, *self._journal_paths()):
+            if path.exists():
+                os.chmod(path, 0o600)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _journal_paths(self) -> tuple[Path, Path]:
+        # SQLite creates these with the database file's mode, but older ones may linger
+        return (
+            self.path.with_name(self.path.name + "-wal"),
+            self.path.with_name(self.path.name + "-shm"),
+        )
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        # one short-lived connection per operation keeps this safe across threads and processes
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, scope: str, key: str, ttl: Optional[float] = None) -> Optional[str]:
+        """Return a fresh entry, judged against ``ttl`` when given instead of the default."""
+
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        try:
+            with self._connection() as conn:
+                row = conn.execute(
+                    "SELECT value, stored_at FROM entries WHERE scope = ? AND key = ?",
+                    (scope, key),
+                ).fetchone()
+                if row is None or now - row[1] > ttl:
+                    return None
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE scope = ? AND key = ?",
+                    (now, scope, key),
+                )
+        except sqlite3.Error as exc:
+            logger.warning("Disk cache read failed: %s", exc)
+            return None
+        value: str = row[0]
+        return value
+
+    def generation(self, scope: str) -> Optional[int]:
+        """Current invalidation generation of ``scope``; None if it cannot be read."""
+
+        try:
+            with self._connection() as conn:
+                row = conn.execute(
+                    "SELECT generation FROM generations WHERE scope = ?", (scope,)
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Disk cache read failed: %s", exc)
+            return None
+        return int(row[0]) if row else 0
+
+    def put(
+        self,
+        scope: str,
+        key: str,
+        value: str,
+        etag: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        now = time.time()
+        etag = etag or etag_for(value)
+        try:
+            with self._connection() as conn:
+                if generation is not None:
+                    row = conn.execute(
+                        "SELECT generation FROM generations WHERE scope = ?", (scope,)
+                    ).fetchone()
+                    if (int(row[0]) if row else 0) != generation:
+                        return
+                revalidated = conn.execute(
+                    "UPDATE entries SET stored_at = ?, accessed_at = ? "
+                    "WHERE scope = ? AND key = ? AND etag = ?",
+                    (now, now, scope, key, etag),
+                ).rowcount
+                if revalidated:
+                    return
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (scope, key, value, etag, len(value), now, now),
+                )
+                self._evict(conn)
+        except sqlite3.Error as exc:
+            logger.warning("Disk cache write failed: %s", exc)
+
+    def delete(self, scope: str, key: Optional[str] = None, prefix: Optional[str] = None) -> None:
+        """Drop one entry, every entry whose key starts with ``prefix``, or the whole scope."""
+
+        try:
+            with self._connection() as conn:
+                if key is not None:
+                    conn.execute("DELETE FROM entries WHERE scope = ? AND key = ?", (scope, key))
+                elif prefix is not None:
+                    conn.execute(
+                        "DELETE FROM entries WHERE scope = ? AND substr(key, 1, ?) = ?",
+                        (scope, len(prefix), prefix),
+                    )
+                else:
+                    conn.execute("DELETE FROM entries WHERE scope = ?", (scope,))
+                conn.execute(
+                    "INSERT INTO generations VALUES (?, 1) "
+                    "ON CONFLICT(scope) DO UPDATE SET generation = generation + 1",
+                    (scope,),
+                )
+        except sqlite3.Error as exc:
+            logger.warning("Disk cache invalidation failed: %s", exc)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # trim to 90% so a cache sitting at the limit does not evict on every write
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        victims = []
+        for scope, key, size in conn.execute(
+            "SELECT scope, key, size FROM entries ORDER BY accessed_at"
+        ):
+            victims.append((scope, key))
+            freed += size
+            if freed >= target:
+                break
+        conn.executemany("DELETE FROM entries WHERE scope = ? AND key = ?", victims)
@@ -4,10 +4,19 @@ from __future__ import annotations
 
 import os
 
-from .server import create_server
+from .admission import AdaptiveLimiter
+from .server import create_server, enable_admission_control
 
 
 def main() -> None:
+    # Shared HTTP hosts see bursty multi-tenant traffic, so shed load instead of queueing it.
+    if os.getenv("MEM0_ADMISSION_CONTROL", "true").lower() in {"1", "true", "yes"}:
+        enable_admission_control(
+            AdaptiveLimiter(
+                initial_limit=int(os.getenv("MEM0_ADMISSION_INITIAL_LIMIT", "20")),
+                max_limit=int(os.getenv("MEM0_ADMISSION_MAX_LIMIT", "200")),
+            )
+        )
     server = create_server()
     # Ensure runtime overrides are respected if Smithery injects a different port/host.
     server.settings.host = os.getenv("HOST", server.settings.host)
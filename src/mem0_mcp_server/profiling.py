@@ -0,0 +1,189 @@
+"""Opt-in profiling helpers: a sampling profiler and slow tool-call capture.
+
+Nothing here runs unless the server enables it; with slow-call capture off the tool
+decorator returns the original function and ``phase`` hands back a shared no-op.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("mem0_mcp_server.profiling")
+
+_TIMINGS: ContextVar[Optional[Dict[str, float]]] = ContextVar("mem0_call_timings", default=None)
+_NOOP: AbstractContextManager[None] = nullcontext()
+
+
+class _Phase:
+    __slots__ = ("_timings", "_name", "_started")
+
+    def __init__(self, timings: Dict[str, float], name: str) -> None:
+        self._timings = timings
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        elapsed = time.perf_counter() - self._started
+        self._timings[self._name] = self._timings.get(self._name, 0.0) + elapsed
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Attribute the enclosed block to ``name`` in the current tool call's breakdown."""
+
+    timings = _TIMINGS.get()
+    if timings is None:
+        return _NOOP
+    return _Phase(timings, name)
+
+
+def detach_timings() -> None:
+    """Stop the current context (e.g. a spawned background task) timing into its parent call."""
+
+    _TIMINGS.set(None)
+
+
+def summarize_args(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe tool arguments by shape only so memory contents never reach the logs."""
+
+    summary: Dict[str, Any] = {}
+    for name, value in arguments.items():
+        if value is None or name == "ctx":
+            continue
+        if isinstance(value, (bool, int, float)):
+            summary[name] = value
+        elif isinstance(value, str):
+            summary[name] = f"str[{len(value)}]"
+        elif isinstance(value, dict):
+            summary[name] = f"dict[{', '.join(sorted(map(str, value)))}]"
+        elif isinstance(value, (list, tuple)):
+            summary[name] = f"list[{len(value)}]"
+        else:
+            summary[name] = type(value).__name__
+    return summary
+
+
+def log_slow_calls(
+    threshold_ms: Optional[float],
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate async tools to log a timing breakdown when they exceed ``threshold_ms``."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if threshold_ms is None:
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            timings: Dict[str, float] = {}
+            token = _TIMINGS.set(timings)
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _TIMINGS.reset(token)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                if elapsed_ms >= threshold_ms:
+                    breakdown = {name: round(value * 1000, 1) for name, value in timings.items()}
+                    breakdown["other"] = round(elapsed_ms - sum(breakdown.values()), 1)
+                    logger.warning(
+                        "Slow tool call %s took %.1fms breakdown_ms=%s args=%s",
+                        func.__name__,
+                        elapsed_ms,
+                        breakdown,
+                        summarize_args(kwargs),
+                    )
+
+        return wrapper
+
+    return decorator
+
+
+class SamplingProfiler:
+    """Wall-clock stack sampler producing folded stacks for flamegraph.pl or speedscope."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self._counts: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("Profiler is already running.")
+            self._counts = Counter()
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._sample, name="mem0-mcp-profiler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> str:
+        """Stop sampling and return one ``frame;frame;frame count`` line per stack."""
+
+        with self._lock:
+            if self._thread is None:
+                raise RuntimeError("Profiler is not running.")
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        return "\n".join(f"{stack} {count}" for stack, count in self._counts.most_common())
+
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                current: Optional[FrameType] = frame
+                while current is not None:
+                    code = current.f_code
+                    stack.append(
+                        f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                    )
+                    current = current.f_back
+                stack.append(names.get(ident, str(ident)))
+                self._counts[";".join(reversed(stack))] += 1
+
+
+def install_signal_toggle(profiler: SamplingProfiler, output_dir: Optional[str] = None) -> None:
+    """Toggle ``profiler`` on SIGUSR2, writing folded stacks to ``output_dir`` on stop."""
+
+    if not hasattr(signal, "SIGUSR2"):  # pragma: no cover - Windows
+        logger.warning("SIGUSR2 is unavailable on this platform; profiler signal not installed.")
+        return
+    directory = Path(output_dir or tempfile.gettempdir()).expanduser()
+
+    def _toggle(signum: int, frame: object) -> None:
+        if not profiler.running:
+            profiler.start()
+            logger.info("Sampling profiler started (send SIGUSR2 again to stop).")
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"mem0-mcp-{os.getpid()}-{int(time.time())}.folded"
+        path.write_text(profiler.stop())
+        logger.info("Sampling profiler stopped; folded stacks written to %s", path)
+
+    signal.signal(signal.SIGUSR2, _toggle)
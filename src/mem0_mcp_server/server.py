@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import hmac
 import json
 import logging
 import os
+import sqlite3
+import threading
+import time
 from typing import Annotated, Any, Callable, Dict, Optional, TypeVar
 
+import anyio
 from dotenv import load_dotenv
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
 from mem0 import MemoryClient
-from mem0.exceptions import MemoryError
+from mem0.exceptions import MemoryError, NetworkError, RateLimitError
 from pydantic import Field
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 
 try:  # Support both package (`python -m mem0_mcp.server`) and script (`python mem0_mcp/server.py`) runs.
+    from .admission import AdaptiveLimiter, BoundedPool, Priority
+    from .disk_cache import DiskCache, scope_for
+    from .profiling import (
+        SamplingProfiler,
+        detach_timings,
+        install_signal_toggle,
+        log_slow_calls,
+        phase,
+    )
     from .schemas import (
         AddMemoryArgs,
         ConfigSchema,
@@ -25,7 +44,20 @@ try:  # Support both package (`python -m mem0_mcp.server`) and script (`python m
         ToolMessage,
     )
 except ImportError:  # pragma: no cover - fallback for script execution
-    from schemas import (
+    from admission import (  # type: ignore[import-not-found,no-redef]
+        AdaptiveLimiter,
+        BoundedPool,
+        Priority,
+    )
+    from disk_cache import DiskCache, scope_for  # type: ignore[import-not-found,no-redef]
+    from profiling import (  # type: ignore[import-not-found,no-redef]
+        SamplingProfiler,
+        detach_timings,
+        install_signal_toggle,
+        log_slow_calls,
+        phase,
+    )
+    from schemas import (  # type: ignore[import-not-found,no-redef]
         AddMemoryArgs,
         ConfigSchema,
         DeleteAllArgs,
@@ -68,9 +100,46 @@ ENV_ENABLE_GRAPH_DEFAULT = os.getenv("MEM0_ENABLE_GRAPH_DEFAULT", "false").lower
     "true",
     "yes",
 }
+# the on-disk cache for get_memory/list_entities is only enabled when a directory is configured
+ENV_CACHE_DIR = os.getenv("MEM0_CACHE_DIR")
+ENV_CACHE_TTL = float(os.getenv("MEM0_CACHE_TTL", "300"))
+ENV_CACHE_MAX_BYTES = int(os.getenv("MEM0_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# profiling is off unless one of these is set; see profiling.py
+ENV_SLOW_CALL_MS = (
+    float(os.environ["MEM0_SLOW_CALL_MS"]) if os.getenv("MEM0_SLOW_CALL_MS") else None
+)
+ENV_PROFILE_SIGNAL = os.getenv("MEM0_PROFILE_SIGNAL", "false").lower() in {"1", "true", "yes"}
+ENV_PROFILE_TOKEN = os.getenv("MEM0_PROFILE_TOKEN")
+ENV_PROFILE_DIR = os.getenv("MEM0_PROFILE_DIR")
+# graph calls are slower and heavier, so they get their own pool, timeout and payload cap
+ENV_GRAPH_MAX_CONCURRENCY = int(os.getenv("MEM0_GRAPH_MAX_CONCURRENCY", "4"))
+ENV_GRAPH_MAX_QUEUE = int(os.getenv("MEM0_GRAPH_MAX_QUEUE", "16"))
+ENV_GRAPH_TIMEOUT = float(os.getenv("MEM0_GRAPH_TIMEOUT", "30"))
+# plain searches are never cached, so graph reads only get a short window (0 disables it)
+ENV_GRAPH_CACHE_TTL = float(os.getenv("MEM0_GRAPH_CACHE_TTL", "30"))
+ENV_GRAPH_MAX_RELATIONS = int(os.getenv("MEM0_GRAPH_MAX_RELATIONS", "100"))
+ENV_GRAPH_RELATION_FIELDS = [
+    field.strip()
+    for field in os.getenv("MEM0_GRAPH_RELATION_FIELDS", "").split(",")
+    if field.strip()
+]
+ENV_GRAPH_BACKGROUND = os.getenv("MEM0_GRAPH_BACKGROUND", "false").lower() in {"1", "true", "yes"}
 
 _CLIENT_CACHE: Dict[str, MemoryClient] = {}
 
+# admission control is off unless a transport opts in (see http_entry)
+_ADMISSION: Optional[AdaptiveLimiter] = None
+_ADMISSION_THREADS: Optional[anyio.CapacityLimiter] = None
+# client methods that are expensive upstream (LLM extraction) and yield to reads under load
+_LOW_PRIORITY_CALLS = {"add"}
+_DISK_CACHE: Optional[DiskCache] = None
+_DISK_CACHE_FAILED = False
+_slow_call_log = log_slow_calls(ENV_SLOW_CALL_MS)
+_GRAPH_POOL = BoundedPool(ENV_GRAPH_MAX_CONCURRENCY, ENV_GRAPH_MAX_QUEUE)
+_GRAPH_THREADS: Optional[anyio.CapacityLimiter] = None
+# keep references to fire-and-forget graph tasks so they are not garbage collected mid-flight
+_BACKGROUND_TASKS: set[asyncio.Task[None]] = set()
+
 
 def _config_value(source: Any, field: str):
     if source is None:
@@ -97,21 +166,173 @@ def _with_default_filters(
     return filters
 
 
-def _mem0_call(func, *args, **kwargs):
+def enable_admission_control(limiter: Optional[AdaptiveLimiter] = None) -> AdaptiveLimiter:
+    """Shed excess tool calls early instead of letting them queue behind the upstream."""
+
+    global _ADMISSION, _ADMISSION_THREADS
+    _ADMISSION = limiter or AdaptiveLimiter()
+    _ADMISSION_THREADS = None
+    return _ADMISSION
+
+
+def _admission_threads(limiter: AdaptiveLimiter) -> anyio.CapacityLimiter:
+    # anyio's default pool stops at 40 threads; admitted calls past that would wait in a
+    # hidden queue, so give them one thread per slot the limiter can ever hand out
+    global _ADMISSION_THREADS
+    if _ADMISSION_THREADS is None:
+        _ADMISSION_THREADS = anyio.CapacityLimiter(limiter.max_limit)
+    return _ADMISSION_THREADS
+
+
+def _graph_threads() -> anyio.CapacityLimiter:
+    # graph workers (running or queued) get their own threads so they never starve plain
+    # calls of the default pool; created lazily because anyio limiters need a running loop
+    global _GRAPH_THREADS
+    if _GRAPH_THREADS is None:
+        _GRAPH_THREADS = anyio.CapacityLimiter(_GRAPH_POOL.capacity)
+    return _GRAPH_THREADS
+
+
+def _trim_graph_relations(result: Any) -> Any:
+    """Cap and optionally project the `relations` list of a graph response."""
+
+    if not isinstance(result, dict) or not isinstance(result.get("relations"), list):
+        return result
+    relations = result["relations"]
+    trimmed = relations[:ENV_GRAPH_MAX_RELATIONS]
+    if ENV_GRAPH_RELATION_FIELDS:
+        trimmed = [
+            {field: rel[field] for field in ENV_GRAPH_RELATION_FIELDS if field in rel}
+            if isinstance(rel, dict)
+            else rel
+            for rel in trimmed
+        ]
+    result = {**result, "relations": trimmed}
+    if len(relations) > len(trimmed):
+        result["relations_total"] = len(relations)
+    return result
+
+
+def _is_overload_error(exc: MemoryError) -> bool:
+    """Only upstream overload (5xx, timeouts, rate limits) should shrink the admission limit."""
+
+    if isinstance(exc, (NetworkError, RateLimitError)):
+        return True
+    status = getattr(exc, "status", None)
+    if isinstance(status, int):
+        return status >= 500 or status == 429
+    return str(getattr(exc, "error_code", "") or "").startswith("HTTP_5")
+
+
+def _overloaded_response(retry_after: int) -> str:
+    return json.dumps(
+        {
+            "error": "server_overloaded",
+            "status": 503,
+            "payload": {"retry_after": retry_after},
+        },
+        ensure_ascii=False,
+    )
+
+
+def _mem0_error_response(exc: MemoryError) -> str:
+    logger.error("Mem0 call failed: %s", exc)
+    # returns the erorr to the model
+    return json.dumps(
+        {
+            "error": str(exc),
+            "status": getattr(exc, "status", None),
+            "payload": getattr(exc, "payload", None),
+        },
+        ensure_ascii=False,
+    )
+
+
+async def _graph_mem0_call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+    """Run a graph call in its own bounded pool, never holding shared admission slots."""
+
+    name = getattr(func, "__name__", "mem0")
+    if not _GRAPH_POOL.try_admit():
+        logger.warning("Shedding graph %s call (pool capacity=%d)", name, _GRAPH_POOL.capacity)
+        return _overloaded_response(_GRAPH_POOL.retry_after())
+
+    call = functools.partial(func, *args, **kwargs)
+    abandoned = threading.Event()
     try:
-        result = func(*args, **kwargs)
-    except MemoryError as exc:  # surface structured error back to MCP client
-        logger.error("Mem0 call failed: %s", exc)
-        # returns the erorr to the model
+        with phase("upstream"), anyio.fail_after(ENV_GRAPH_TIMEOUT):
+            result = await anyio.to_thread.run_sync(
+                _GRAPH_POOL.run,
+                lambda: _trim_graph_relations(call()),
+                abandoned,
+                limiter=_graph_threads(),
+                abandon_on_cancel=True,
+            )
+    except TimeoutError:
+        logger.warning("Mem0 graph call %s timed out", name)
         return json.dumps(
             {
-                "error": str(exc),
-                "status": getattr(exc, "status", None),
-                "payload": getattr(exc, "payload", None),
+                "error": "graph_timeout",
+                "status": 504,
+                "payload": {"timeout": ENV_GRAPH_TIMEOUT},
             },
             ensure_ascii=False,
         )
-    return json.dumps(result, ensure_ascii=False)
+    except MemoryError as exc:  # surface structured error back to MCP client
+        return _mem0_error_response(exc)
+    finally:
+        # a worker still queued for a slot skips the upstream call; a running one keeps
+        # its slot until Mem0 answers, so timeouts cannot push past the pool's cap
+        abandoned.set()
+    with phase("encode"):
+        return json.dumps(result, ensure_ascii=False)
+
+
+async def _mem0_call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+    limiter = _ADMISSION
+    if limiter is not None:
+        priority = (
+            Priority.LOW if getattr(func, "__name__", "") in _LOW_PRIORITY_CALLS else Priority.HIGH
+        )
+        if not limiter.try_acquire(priority):
+            logger.warning(
+                "Shedding %s call (in_flight=%d, limit=%d)",
+                getattr(func, "__name__", "mem0"),
+                limiter.in_flight,
+                limiter.limit,
+            )
+            return _overloaded_response(limiter.retry_after())
+
+    # run the blocking SDK call off the event loop so concurrent sessions are not serialized
+    started = time.monotonic()
+    dropped = False
+    cancelled = False
+    try:
+        with phase("upstream"):
+            result = await anyio.to_thread.run_sync(
+                functools.partial(func, *args, **kwargs),
+                limiter=_admission_threads(limiter) if limiter is not None else None,
+            )
+    except MemoryError as exc:  # surface structured error back to MCP client
+        dropped = _is_overload_error(exc)
+        return _mem0_error_response(exc)
+    except anyio.get_cancelled_exc_class():
+        # a client cancelling its own call says nothing about upstream health
+        cancelled = True
+        raise
+    except BaseException:
+        dropped = True
+        raise
+    finally:
+        if limiter is not None and cancelled:
+            limiter.abandon()
+        elif limiter is not None:
+            limiter.release(
+                time.monotonic() - started,
+                dropped=dropped,
+                method=getattr(func, "__name__", "mem0"),
+            )
+    with phase("encode"):
+        return json.dumps(result, ensure_ascii=False)
 
 
 def _resolve_settings(ctx: Context | None) -> tuple[str, str, bool]:
@@ -139,6 +360,159 @@ def _mem0_client(api_key: str) -> MemoryClient:
     return client
 
 
+def _disk_cache() -> Optional[DiskCache]:
+    global _DISK_CACHE, _DISK_CACHE_FAILED
+    if _DISK_CACHE is None and ENV_CACHE_DIR and not _DISK_CACHE_FAILED:
+        try:
+            _DISK_CACHE = DiskCache(
+                ENV_CACHE_DIR, max_bytes=ENV_CACHE_MAX_BYTES, ttl=ENV_CACHE_TTL
+            )
+        except (OSError, sqlite3.Error) as exc:
+            # a bad cache dir must not fail tool calls; run uncached instead of retrying
+            _DISK_CACHE_FAILED = True
+            logger.warning("Disk cache disabled (MEM0_CACHE_DIR=%s): %s", ENV_CACHE_DIR, exc)
+    return _DISK_CACHE
+
+
+async def _cached_mem0_call(
+    api_key: str,
+    key: str,
+    func: Callable[..., Any],
+    *args: Any,
+    graph: bool = False,
+    **kwargs: Any,
+) -> str:
+    """Serve a read from the disk cache, falling back to Mem0 and storing successes.
+
+    ``graph=True`` runs the fetch in the graph pool and applies the graph cache TTL.
+    """
+
+    call = _graph_mem0_call if graph else _mem0_call
+    ttl = ENV_GRAPH_CACHE_TTL if graph else None
+    cache = _disk_cache()
+    if cache is None or (ttl is not None and ttl <= 0):
+        return await call(func, *args, **kwargs)
+    scope = scope_for(api_key)
+
+    def lookup() -> tuple[Optional[str], Optional[int]]:
+        return cache.get(scope, key, ttl=ttl), cache.generation(scope)
+
+    # SQLite may wait on other processes' locks, so keep it off the event loop
+    with phase("cache"):
+        cached, generation = await anyio.to_thread.run_sync(lookup)
+    if cached is not None:
+        return cached
+
+    fetched: list[Any] = []
+
+    @functools.wraps(func)
+    def fetch(*call_args: Any, **call_kwargs: Any) -> Any:
+        result = func(*call_args, **call_kwargs)
+        if call_kwargs.get("enable_graph"):
+            result = _trim_graph_relations(result)
+        fetched.append(result)
+        return result
+
+    response = await call(fetch, *args, **kwargs)
+    if fetched and generation is not None:
+        result = fetched[0]
+        # Mem0 has no conditional GET, so revalidate stale entries on updated_at instead
+        updated_at = result.get("updated_at") if isinstance(result, dict) else None
+        with phase("cache"):
+            await anyio.to_thread.run_sync(
+                functools.partial(
+                    cache.put,
+                    scope,
+                    key,
+                    json.dumps(result, ensure_ascii=False),
+                    etag=updated_at,
+                    generation=generation,
+                )
+            )
+    return response
+
+
+async def _invalidate_cache(
+    api_key: str, key: Optional[str] = None, prefix: Optional[str] = None
+) -> None:
+    cache = _disk_cache()
+    if cache is not None:
+        with phase("cache"):
+            await anyio.to_thread.run_sync(
+                functools.partial(cache.delete, scope_for(api_key), key, prefix=prefix)
+            )
+
+
+async def _graph_read(api_key: str, func: Callable[..., Any], payload: Dict[str, Any]) -> str:
+    """Run a graph-enabled read in the graph pool and its own `graph:` cache namespace."""
+
+    digest = hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    key = f"graph:{func.__name__}:{digest}"
+    return await _cached_mem0_call(api_key, key, func, graph=True, **payload)
+
+
+async def _vector_then_graph(
+    ctx: Context[Any, Any, Any],
+    tool: str,
+    api_key: str,
+    func: Callable[..., Any],
+    payload: Dict[str, Any],
+) -> str:
+    """Answer with vector results now and push graph relations as a log notification later."""
+
+    request_id = ctx.request_id
+
+    async def send_relations() -> None:
+        # the task inherits a copy of this call's context; keep its cache/upstream time out
+        # of the foreground call's slow-call breakdown
+        detach_timings()
+        data: Dict[str, Any] = {"tool": tool, "request_id": request_id}
+        if "query" in payload:
+            data["query"] = payload["query"]
+        try:
+            response = json.loads(await _graph_read(api_key, func, payload))
+            if isinstance(response, dict) and "error" in response:
+                data["error"] = response
+            else:
+                data["relations"] = (
+                    response.get("relations", []) if isinstance(response, dict) else response
+                )
+            await ctx.session.send_log_message(
+                level="error" if "error" in data else "info",
+                data=data,
+                logger="mem0_mcp_server.graph",
+            )
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            logger.info("Session closed before graph relations for %s were sent", tool)
+        except Exception:  # noqa: BLE001 - background work must never crash the server
+            logger.exception("Background graph lookup for %s failed", tool)
+
+    task = asyncio.create_task(send_relations())
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return await _mem0_call(func, **{**payload, "enable_graph": False})
+
+
+async def _read_with_graph(
+    ctx: Context[Any, Any, Any] | None,
+    tool: str,
+    api_key: str,
+    func: Callable[..., Any],
+    payload: Dict[str, Any],
+) -> str:
+    if not payload.get("enable_graph"):
+        return await _mem0_call(func, **payload)
+    if ENV_GRAPH_BACKGROUND and ctx is not None:
+        return await _vector_then_graph(ctx, tool, api_key, func, payload)
+    return await _graph_read(api_key, func, payload)
+
+
+def _is_profile_admin(request: Request) -> bool:
+    # compare bytes: compare_digest raises TypeError on non-ASCII str input
+    expected = f"Bearer {ENV_PROFILE_TOKEN}".encode()
+    return hmac.compare_digest(request.headers.get("authorization", "").encode(), expected)
+
+
 def _default_enable_graph(enable_graph: Optional[bool], default: bool) -> bool:
     if enable_graph is None:
         return default
@@ -164,11 +538,39 @@ def create_server() -> FastMCP:
         transport_security=TransportSecuritySettings(enable_dns_rebinding_protection=False),
     )
 
+    # on-demand sampling profiler: SIGUSR2 toggle and/or token-protected HTTP endpoints
+    if ENV_PROFILE_SIGNAL or ENV_PROFILE_TOKEN:
+        profiler = SamplingProfiler()
+        if ENV_PROFILE_SIGNAL:
+            install_signal_toggle(profiler, ENV_PROFILE_DIR)
+
+        if ENV_PROFILE_TOKEN:
+
+            async def start_profile(request: Request) -> Response:
+                if not _is_profile_admin(request):
+                    return JSONResponse({"error": "forbidden"}, status_code=403)
+                if profiler.running:
+                    return JSONResponse({"error": "profiler_running"}, status_code=409)
+                profiler.start()
+                return JSONResponse({"status": "started"})
+
+            async def stop_profile(request: Request) -> Response:
+                if not _is_profile_admin(request):
+                    return JSONResponse({"error": "forbidden"}, status_code=403)
+                if not profiler.running:
+                    return JSONResponse({"error": "profiler_not_running"}, status_code=409)
+                return PlainTextResponse(profiler.stop())
+
+            # custom_route is unannotated upstream; register directly to keep handlers typed
+            server.custom_route("/admin/profile/start", methods=["POST"])(start_profile)
+            server.custom_route("/admin/profile/stop", methods=["POST"])(stop_profile)
+
     # graph is disabled by default to make queries simpler and fast
     # Mention " Enable/Use graph while calling memory " in your system prompt to run it in each instance
 
     @server.tool(description="Store a new preference, fact, or conversation snippet. Requires at least one: user_id, agent_id, or run_id.")
-    def add_memory(
+    @_slow_call_log
+    async def add_memory(
         text: Annotated[
             str,
             Field(
@@ -212,16 +614,19 @@ def create_server() -> FastMCP:
         """Write durable information to Mem0."""
 
         api_key, default_user, graph_default = _resolve_settings(ctx)
-        args = AddMemoryArgs(
-            text=text,
-            messages=[ToolMessage(**msg) for msg in messages] if messages else None,
-            user_id=user_id if user_id else (default_user if not (agent_id or run_id) else None),
-            agent_id=agent_id,
-            app_id=app_id,
-            run_id=run_id,
-            metadata=metadata,
-            enable_graph=_default_enable_graph(enable_graph, graph_default),
-        )
+        with phase("validate"):
+            args = AddMemoryArgs(
+                text=text,
+                messages=[ToolMessage(**msg) for msg in messages] if messages else None,
+                user_id=user_id
+                if user_id
+                else (default_user if not (agent_id or run_id) else None),
+                agent_id=agent_id,
+                app_id=app_id,
+                run_id=run_id,
+                metadata=metadata,
+                enable_graph=_default_enable_graph(enable_graph, graph_default),
+            )
         payload = args.model_dump(exclude_none=True)
         payload.setdefault("enable_graph", graph_default)
         conversation = payload.pop("messages", None)
@@ -241,7 +646,12 @@ def create_server() -> FastMCP:
             payload.pop("text", None)
 
         client = _mem0_client(api_key)
-        return _mem0_call(client.add, conversation, **payload)
+        response = await _mem0_call(client.add, conversation, **payload)
+        await _invalidate_cache(api_key, "entities")
+        # add may UPDATE or DELETE existing memories (possibly later, as it runs async upstream)
+        await _invalidate_cache(api_key, prefix="memory:")
+        await _invalidate_cache(api_key, prefix="graph:")
+        return response
 
     @server.tool(
         description="""Run a semantic search over existing memories.
@@ -256,7 +666,8 @@ def create_server() -> FastMCP:
         user_id is automatically added to filters if not provided.
         """
     )
-    def search_memories(
+    @_slow_call_log
+    async def search_memories(
         query: Annotated[str, Field(description="Natural language description of what to find.")],
         filters: Annotated[
             Optional[Dict[str, Any]],
@@ -277,17 +688,19 @@ def create_server() -> FastMCP:
         """Semantic search against existing memories."""
 
         api_key, default_user, graph_default = _resolve_settings(ctx)
-        args = SearchMemoriesArgs(
-            query=query,
-            filters=filters,
-            limit=limit,
-            enable_graph=_default_enable_graph(enable_graph, graph_default),
-        )
+        with phase("validate"):
+            args = SearchMemoriesArgs(
+                query=query,
+                filters=filters,
+                limit=limit,
+                enable_graph=_default_enable_graph(enable_graph, graph_default),
+            )
         payload = args.model_dump(exclude_none=True)
-        payload["filters"] = _with_default_filters(default_user, payload.get("filters"))
+        with phase("filters"):
+            payload["filters"] = _with_default_filters(default_user, payload.get("filters"))
         payload.setdefault("enable_graph", graph_default)
         client = _mem0_client(api_key)
-        return _mem0_call(client.search, **payload)
+        return await _read_with_graph(ctx, "search_memories", api_key, client.search, payload)
 
     @server.tool(
         description="""Page through memories using filters instead of search.
@@ -302,7 +715,8 @@ def create_server() -> FastMCP:
         user_id is automatically added to filters if not provided.
         """
     )
-    def get_memories(
+    @_slow_call_log
+    async def get_memories(
         filters: Annotated[
             Optional[Dict[str, Any]],
             Field(default=None, description="Structured filters; user_id injected automatically."),
@@ -325,22 +739,25 @@ def create_server() -> FastMCP:
         """List memories via structured filters or pagination."""
 
         api_key, default_user, graph_default = _resolve_settings(ctx)
-        args = GetMemoriesArgs(
-            filters=filters,
-            page=page,
-            page_size=page_size,
-            enable_graph=_default_enable_graph(enable_graph, graph_default),
-        )
+        with phase("validate"):
+            args = GetMemoriesArgs(
+                filters=filters,
+                page=page,
+                page_size=page_size,
+                enable_graph=_default_enable_graph(enable_graph, graph_default),
+            )
         payload = args.model_dump(exclude_none=True)
-        payload["filters"] = _with_default_filters(default_user, payload.get("filters"))
+        with phase("filters"):
+            payload["filters"] = _with_default_filters(default_user, payload.get("filters"))
         payload.setdefault("enable_graph", graph_default)
         client = _mem0_client(api_key)
-        return _mem0_call(client.get_all, **payload)
+        return await _read_with_graph(ctx, "get_memories", api_key, client.get_all, payload)
 
     @server.tool(
         description="Delete every memory in the given user/agent/app/run but keep the entity."
     )
-    def delete_all_memories(
+    @_slow_call_log
+    async def delete_all_memories(
         user_id: Annotated[
             Optional[str], Field(default=None, description="User scope to delete; defaults to server user.")
         ] = None,
@@ -358,26 +775,31 @@ def create_server() -> FastMCP:
         """Bulk-delete every memory in the confirmed scope."""
 
         api_key, default_user, _ = _resolve_settings(ctx)
-        args = DeleteAllArgs(
-            user_id=user_id or default_user,
-            agent_id=agent_id,
-            app_id=app_id,
-            run_id=run_id,
-        )
+        with phase("validate"):
+            args = DeleteAllArgs(
+                user_id=user_id or default_user,
+                agent_id=agent_id,
+                app_id=app_id,
+                run_id=run_id,
+            )
         payload = args.model_dump(exclude_none=True)
         client = _mem0_client(api_key)
-        return _mem0_call(client.delete_all, **payload)
+        response = await _mem0_call(client.delete_all, **payload)
+        await _invalidate_cache(api_key)
+        return response
 
     @server.tool(description="List which users/agents/apps/runs currently hold memories.")
-    def list_entities(ctx: Context | None = None) -> str:
+    @_slow_call_log
+    async def list_entities(ctx: Context | None = None) -> str:
         """List users/agents/apps/runs with stored memories."""
 
         api_key, _, _ = _resolve_settings(ctx)
         client = _mem0_client(api_key)
-        return _mem0_call(client.users)
+        return await _cached_mem0_call(api_key, "entities", client.users)
 
     @server.tool(description="Fetch a single memory once you know its memory_id.")
-    def get_memory(
+    @_slow_call_log
+    async def get_memory(
         memory_id: Annotated[str, Field(description="Exact memory_id to fetch.")],
         ctx: Context | None = None,
     ) -> str:
@@ -385,10 +807,11 @@ def create_server() -> FastMCP:
 
         api_key, _, _ = _resolve_settings(ctx)
         client = _mem0_client(api_key)
-        return _mem0_call(client.get, memory_id)
+        return await _cached_mem0_call(api_key, f"memory:{memory_id}", client.get, memory_id)
 
     @server.tool(description="Overwrite an existing memory’s text.")
-    def update_memory(
+    @_slow_call_log
+    async def update_memory(
         memory_id: Annotated[str, Field(description="Exact memory_id to overwrite.")],
         text: Annotated[str, Field(description="Replacement text for the memory.")],
         ctx: Context | None = None,
@@ -397,10 +820,14 @@ def create_server() -> FastMCP:
 
         api_key, _, _ = _resolve_settings(ctx)
         client = _mem0_client(api_key)
-        return _mem0_call(client.update, memory_id=memory_id, text=text)
+        response = await _mem0_call(client.update, memory_id=memory_id, text=text)
+        await _invalidate_cache(api_key, f"memory:{memory_id}")
+        await _invalidate_cache(api_key, prefix="graph:")
+        return response
 
     @server.tool(description="Delete one memory after the user confirms its memory_id.")
-    def delete_memory(
+    @_slow_call_log
+    async def delete_memory(
         memory_id: Annotated[str, Field(description="Exact memory_id to delete.")],
         ctx: Context | None = None,
     ) -> str:
@@ -408,12 +835,17 @@ def create_server() -> FastMCP:
 
         api_key, _, _ = _resolve_settings(ctx)
         client = _mem0_client(api_key)
-        return _mem0_call(client.delete, memory_id)
+        response = await _mem0_call(client.delete, memory_id)
+        await _invalidate_cache(api_key, f"memory:{memory_id}")
+        await _invalidate_cache(api_key, "entities")
+        await _invalidate_cache(api_key, prefix="graph:")
+        return response
 
     @server.tool(
         description="Remove a user/agent/app/run record entirely (and cascade-delete its memories)."
     )
-    def delete_entities(
+    @_slow_call_log
+    async def delete_entities(
         user_id: Annotated[
             Optional[str], Field(default=None, description="Delete this user and its memories.")
         ] = None,
@@ -431,12 +863,13 @@ def create_server() -> FastMCP:
         """Delete a user/agent/app/run (and its memories) once the user confirms the scope."""
 
         api_key, _, _ = _resolve_settings(ctx)
-        args = DeleteEntitiesArgs(
-            user_id=user_id,
-            agent_id=agent_id,
-            app_id=app_id,
-            run_id=run_id,
-        )
+        with phase("validate"):
+            args = DeleteEntitiesArgs(
+                user_id=user_id,
+                agent_id=agent_id,
+                app_id=app_id,
+                run_id=run_id,
+            )
         if not any([args.user_id, args.agent_id, args.app_id, args.run_id]):
             return json.dumps(
                 {
@@ -447,7 +880,9 @@ def create_server() -> FastMCP:
             )
         payload = args.model_dump(exclude_none=True)
         client = _mem0_client(api_key)
-        return _mem0_call(client.delete_users, **payload)
+        response = await _mem0_call(client.delete_users, **payload)
+        await _invalidate_cache(api_key)
+        return response
 
     # Add a simple prompt for server capabilities
     @server.prompt()
@@ -0,0 +1,69 @@
+import threading
+
+from mem0_mcp_server.admission import AdaptiveLimiter, BoundedPool, Priority
+
+
+def _complete(limiter: AdaptiveLimiter, method: str, latency: float, dropped: bool = False) -> None:
+    assert limiter.try_acquire(Priority.LOW if method == "add" else Priority.HIGH)
+    limiter.release(latency, dropped=dropped, method=method)
+
+
+def test_slow_writes_do_not_shrink_limit_on_idle_server():
+    limiter = AdaptiveLimiter(initial_limit=20)
+    for index in range(200):
+        if index % 10 < 3:
+            _complete(limiter, "add", 1.5)
+        else:
+            _complete(limiter, "get", 0.15)
+
+    assert limiter.limit == 20
+    # an idle server must still admit a burst of writes
+    assert all(limiter.try_acquire(Priority.LOW) for _ in range(3))
+
+
+def test_sustained_congestion_backs_off():
+    limiter = AdaptiveLimiter(initial_limit=20, congestion_window=5)
+    for _ in range(10):
+        _complete(limiter, "search", 0.1)
+    for _ in range(20):
+        _complete(limiter, "search", 2.0)
+
+    assert limiter.limit < 20
+
+
+def test_single_slow_completion_does_not_back_off():
+    limiter = AdaptiveLimiter(initial_limit=20)
+    for _ in range(10):
+        _complete(limiter, "search", 0.1)
+    _complete(limiter, "search", 5.0)
+
+    assert limiter.limit == 20
+
+
+def test_cancelled_call_frees_slot_without_latency_sample():
+    limiter = AdaptiveLimiter(initial_limit=20)
+    for _ in range(10):
+        _complete(limiter, "search", 0.3)
+    assert limiter.try_acquire()
+    limiter.abandon()
+    for _ in range(10):
+        _complete(limiter, "search", 0.3)
+
+    assert limiter.in_flight == 0
+    assert limiter.limit == 20
+
+
+def test_bounded_pool_sheds_past_queue_and_skips_abandoned_work():
+    pool = BoundedPool(max_concurrency=1, max_queue=1)
+    assert pool.try_admit() and pool.try_admit()
+    assert not pool.try_admit()
+
+    abandoned = threading.Event()
+    abandoned.set()
+    calls = []
+    # a caller that timed out while queued must not reach upstream
+    assert pool.run(lambda: calls.append("late"), abandoned) is None
+    assert pool.run(lambda: "ok", threading.Event()) == "ok"
+
+    assert calls == []
+    assert pool.try_admit()
@@ -0,0 +1,55 @@
+import sqlite3
+import stat
+
+from mem0_mcp_server.disk_cache import DiskCache
+
+
+def test_put_after_invalidation_is_discarded(tmp_path):
+    cache = DiskCache(tmp_path)
+    generation = cache.generation("scope")
+    # an update lands between the read's upstream fetch and its cache write
+    cache.delete("scope", "memory:1")
+    cache.put("scope", "memory:1", '{"memory": "old"}', generation=generation)
+
+    assert cache.get("scope", "memory:1") is None
+
+
+def test_put_with_current_generation_is_stored(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("scope", "memory:1", '{"memory": "new"}', generation=cache.generation("scope"))
+
+    assert cache.get("scope", "memory:1") == '{"memory": "new"}'
+
+
+def test_prefix_invalidation_keeps_other_keys(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("scope", "graph:search:abc", "1")
+    cache.put("scope", "entities", "2")
+    cache.delete("scope", prefix="graph:")
+
+    assert cache.get("scope", "graph:search:abc") is None
+    assert cache.get("scope", "entities") == "2"
+
+
+def test_cache_files_are_private(tmp_path):
+    cache = DiskCache(tmp_path / "cache")
+    # hold a reader open so the -wal/-shm files exist while the entry is written
+    reader = sqlite3.connect(cache.path)
+    try:
+        reader.execute("SELECT COUNT(*) FROM entries").fetchone()
+        cache.put("scope", "memory:1", '{"memory": "secret"}')
+        files = [cache.path, *cache._journal_paths()]
+        assert all(path.exists() for path in files)
+        assert stat.S_IMODE(cache.path.parent.stat().st_mode) == 0o700
+        for path in files:
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    finally:
+        reader.close()
+
+
+def test_per_call_ttl_overrides_default(tmp_path):
+    cache = DiskCache(tmp_path, ttl=300.0)
+    cache.put("scope", "graph:search:abc", "1")
+
+    assert cache.get("scope", "graph:search:abc") == "1"
+    assert cache.get("scope", "graph:search:abc", ttl=-1.0) is None
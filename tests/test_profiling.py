@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import time
+
+from mem0_mcp_server import profiling
+from mem0_mcp_server.profiling import detach_timings, log_slow_calls, phase, summarize_args
+
+
+def test_summarize_args_never_includes_string_contents():
+    secret = "my bank pin is 4921"
+    summary = summarize_args(
+        {
+            "text": secret,
+            "messages": [{"role": "user", "content": secret}],
+            "metadata": {"note": secret},
+            "filters": {"AND": [{"user_id": secret}]},
+            "limit": 5,
+            "enable_graph": True,
+            "ctx": object(),
+            "run_id": None,
+        }
+    )
+
+    assert secret not in repr(summary)
+    assert summary == {
+        "text": f"str[{len(secret)}]",
+        "messages": "list[1]",
+        "metadata": "dict[note]",
+        "filters": "dict[AND]",
+        "limit": 5,
+        "enable_graph": True,
+    }
+
+
+def test_disabled_slow_call_log_is_free():
+    async def tool() -> str:
+        return "ok"
+
+    assert log_slow_calls(None)(tool) is tool
+    assert phase("upstream") is profiling._NOOP
+
+
+def test_slow_call_is_logged_with_breakdown(caplog):
+    @log_slow_calls(10)
+    async def slow_tool(text: str) -> str:
+        with phase("upstream"):
+            await asyncio.sleep(0.02)
+        return "ok"
+
+    @log_slow_calls(10_000)
+    async def fast_tool(text: str) -> str:
+        return "ok"
+
+    with caplog.at_level(logging.WARNING, logger="mem0_mcp_server.profiling"):
+        assert asyncio.run(slow_tool(text="private")) == "ok"
+        assert asyncio.run(fast_tool(text="private")) == "ok"
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert "slow_tool" in message and "'upstream'" in message and "str[7]" in message
+    assert "private" not in message
+
+
+def test_detached_task_does_not_time_into_caller(caplog):
+    @log_slow_calls(0)
+    async def tool() -> None:
+        async def background() -> None:
+            detach_timings()
+            with phase("upstream"):
+                time.sleep(0.01)
+
+        await asyncio.create_task(background())
+
+    with caplog.at_level(logging.WARNING, logger="mem0_mcp_server.profiling"):
+        asyncio.run(tool())
+
+    assert "'upstream'" not in caplog.records[0].getMessage()